@@ -0,0 +1,100 @@
+"""In-process response cache for repeated startup Q&A queries.
+
+Two tiers: an exact-match LRU keyed by SHA256 of the normalized
+(question, context) pair, and an optional semantic tier that falls back
+to embedding cosine similarity when sentence-transformers is installed.
+Cache hits return in microseconds instead of a full Groq round trip.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Semantic tier is optional - only used if sentence-transformers is installed
+try:
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+
+
+class LLMCache:
+    """LRU cache with TTL for LLM responses, plus optional semantic matching"""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 3600.0,
+                 semantic_threshold: float = 0.92, use_semantic: bool = False):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+        self.use_semantic = use_semantic and SEMANTIC_AVAILABLE
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = OrderedDict()  # key -> (expires_at, response_dict)
+        self._embeddings = {}  # key -> embedding vector (semantic tier only)
+        self._model = None
+
+    @staticmethod
+    def make_key(question: str, context: Optional[str] = None) -> str:
+        """Build a stable cache key from the normalized question and context"""
+        raw = json.dumps(
+            {"q": question.strip().lower(), "ctx": context},
+            sort_keys=True
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str, question: Optional[str] = None) -> Optional[dict]:
+        """Return a cached response, trying exact match then semantic match"""
+        self._evict_expired()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+        if self.use_semantic and question:
+            match = self._semantic_lookup(question)
+            if match is not None:
+                self.stats["hits"] += 1
+                return match
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, response: dict, question: Optional[str] = None):
+        """Store a response, evicting the least recently used entry if full"""
+        self._entries[key] = (time.time() + self.ttl, response)
+        self._entries.move_to_end(key)
+        if self.use_semantic and question:
+            self._embeddings[key] = self._embed(question)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._embeddings.pop(evicted, None)
+
+    def _evict_expired(self):
+        now = time.time()
+        expired = [k for k, (exp, _) in self._entries.items() if exp < now]
+        for key in expired:
+            del self._entries[key]
+            self._embeddings.pop(key, None)
+
+    def _embed(self, text: str):
+        if self._model is None:
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        return self._model.encode(text, normalize_embeddings=True)
+
+    def _semantic_lookup(self, question: str) -> Optional[dict]:
+        """Find a cached answer whose question embedding is close enough"""
+        if not self._embeddings:
+            return None
+        query_vec = self._embed(question)
+        best_key, best_sim = None, 0.0
+        for key, vec in self._embeddings.items():
+            sim = float(query_vec @ vec)  # vectors are normalized
+            if sim > best_sim:
+                best_key, best_sim = key, sim
+        if best_key is not None and best_sim >= self.semantic_threshold:
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][1]
+        return None
@@ -1,27 +1,95 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, constr
+try:
+    import ahocorasick
+except ImportError:  # optional fast path; stdlib routing works without it
+    ahocorasick = None
+import asyncio
+import hashlib
+import logging
+import logging.handlers
 import httpx
+import orjson
 import os
+import queue
+import re
 import time
-from datetime import datetime
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from tenacity import retry, retry_if_exception_type, retry_if_result, \
+    stop_after_attempt, wait_exponential_jitter
+from typing import Final, Optional, List
 
 from dotenv import load_dotenv
 import os
 
+from core.cache import LLMCache
+
 # Load environment variables
 load_dotenv()
 
-# Debug: Print to see if key is loaded
-print(f"GROQ_API_KEY loaded: {'Yes' if os.getenv('GROQ_API_KEY') else 'No'}")
-print(f"Key starts with: {os.getenv('GROQ_API_KEY', 'NOT_FOUND')[:10]}...")
+# Logging - handlers hang off a queue so a slow stdout flush happens on a
+# background thread instead of blocking the event loop
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger("kenya_startup")
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *logging.getLogger().handlers, respect_handler_level=True
+)
+logging.getLogger().handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("GROQ_API_KEY loaded: %s", "yes" if os.getenv("GROQ_API_KEY") else "no")
+
+# Response cache - repeated questions skip the Groq round trip entirely
+query_cache = LLMCache(
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "512")),
+    ttl=float(os.getenv("CACHE_TTL", "3600")),
+    use_semantic=os.getenv("CACHE_SEMANTIC", "").lower() in ("1", "true", "yes")
+)
+
+# Total prompt-token budget per Groq call (system + user)
+_MAX_PROMPT_TOKENS = 6000
+
+# Cap concurrent Groq calls so bursts don't trip Groq's rate limit
+GROQ_SEMAPHORE = asyncio.Semaphore(int(os.getenv("GROQ_CONCURRENCY", "8")))
+
+# Connection-pool tuning for the shared Groq client (overridable by ops)
+GROQ_MAX_CONN = int(os.getenv("GROQ_MAX_CONN", "1000"))
+GROQ_MAX_KEEPALIVE = int(os.getenv("GROQ_MAX_KEEPALIVE", "100"))
+GROQ_KEEPALIVE_EXPIRY = float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "30.0"))
+
+# Shared HTTP client lifecycle - one pooled client for all Groq calls
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fail fast: a missing key should abort boot, not 500 on the first query
+    if GROQ_HEADERS is None:
+        raise RuntimeError("GROQ_API_KEY environment variable not set")
+    app.state.groq_client = httpx.AsyncClient(
+        base_url="https://api.groq.com",
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=GROQ_MAX_CONN,
+            max_keepalive_connections=GROQ_MAX_KEEPALIVE,
+            keepalive_expiry=GROQ_KEEPALIVE_EXPIRY
+        )
+    )
+    logger.info("System prompt sha256: %s", SYSTEM_PROMPT_SHA)
+    yield
+    await app.state.groq_client.aclose()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Kenya Startup Navigator API",
     description="AI-powered guidance for Kenya's startup ecosystem",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - Allow your frontend
@@ -37,11 +105,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request/Response models
+# Request/Response models - bounded inputs so oversized prompts can't
+# inflate Groq tokenization cost or wall time
 class QueryRequest(BaseModel):
-    question: str
+    question: constr(strip_whitespace=True, min_length=1, max_length=4000)
     startup_profile: Optional[dict] = None
-    context: Optional[str] = None
+    context: Optional[constr(max_length=8000)] = None
 
 class QueryResponse(BaseModel):
     answer: str
@@ -50,44 +119,54 @@ class QueryResponse(BaseModel):
     sources: List[str]
     suggested_follow_ups: List[str]
     timestamp: str
+    cached_tokens: int = 0
+    cache_hit_rate: float = 0.0
+
+_ts_cache = [0, ""]
+
+def now_iso() -> str:
+    """ISO-8601 UTC timestamp, cached at one-second granularity"""
+    now_s = int(time.time())
+    if now_s != _ts_cache[0]:
+        _ts_cache[0] = now_s
+        _ts_cache[1] = datetime.fromtimestamp(now_s, tz=timezone.utc) \
+            .isoformat().replace("+00:00", "Z")
+    return _ts_cache[1]
+
+# Health checks - static bodies precomputed once; these endpoints get
+# hammered by load balancers so only the timestamp is stamped per call
+_ROOT_BODY = {
+    "message": "🚀 Kenya Startup Navigator API",
+    "status": "online",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "query": "/api/v1/query"
+    }
+}
+
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "service": "Kenya Startup Navigator API"
+}
 
-# Health checks
 @app.get("/")
 async def root():
-    return {
-        "message": "🚀 Kenya Startup Navigator API",
-        "status": "online",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "query": "/api/v1/query"
-        }
-    }
+    return _ROOT_BODY
 
 @app.get("/health")
 async def health_check():
     return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "Kenya Startup Navigator API"
+        **_HEALTH_STATIC,
+        "timestamp": now_iso(),
+        "cache": query_cache.stats,
+        "prefilter": prefilter_stats
     }
 
-# Main query endpoint
-@app.post("/api/v1/query", response_model=QueryResponse)
-async def process_query(request: QueryRequest):
-    start_time = time.time()
-    
-    try:
-        # Get API key from environment
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise HTTPException(
-                status_code=500, 
-                detail="GROQ_API_KEY environment variable not set"
-            )
-        
-        # Enhanced system prompt for Kenya startup ecosystem
-        system_prompt = """You are KenyaStartup AI, an expert advisor on Kenya's startup ecosystem with deep knowledge of:
+# Enhanced system prompt for Kenya startup ecosystem. Kept as a single
+# module constant so the exact same prefix hits Groq on every call and
+# Groq's automatic prompt caching can reuse it.
+SYSTEM_PROMPT: Final[str] = """You are KenyaStartup AI, an expert advisor on Kenya's startup ecosystem with deep knowledge of:
 
 🏦 FUNDING LANDSCAPE:
 - Major VCs: TLcom Capital (Series A/B, $5-15M), Novastar Ventures (fintech, $2-10M), GreenTec Capital (impact, $1-5M), 4DX Ventures (early stage, $250K-2M)
@@ -118,147 +197,387 @@ Provide specific, actionable advice with:
 4. Kenyan regulatory context
 5. Clear structure with headers and bullet points"""
 
-        # Prepare Groq API request
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        # Build context-aware prompt
-        user_prompt = request.question
-        if request.context:
-            user_prompt += f"\n\nAdditional context: {request.context}"
-        
-        payload = {
-            "model": "llama3-70b-8192",
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 2048
-        }
-        
-        # Make API call to Groq
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            
-            if response.status_code == 401:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Invalid Groq API key. Please check your GROQ_API_KEY."
-                )
-            elif response.status_code == 429:
-                raise HTTPException(
-                    status_code=429,
-                    detail="Rate limit exceeded. Please try again in a moment."
-                )
-            elif response.status_code != 200:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Groq API error: {response.status_code} - {response.text}"
-                )
-            
-            data = response.json()
-            
-            # Extract response content
-            if "choices" in data and data["choices"]:
-                content = data["choices"][0]["message"]["content"]
-            else:
-                content = "I apologize, but I couldn't generate a response. Please try again."
-            
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Generate follow-up questions
-            follow_ups = generate_follow_ups(request.question)
-            
-            # Calculate confidence based on response quality
-            confidence = calculate_confidence(content, request.question)
-            
-            # Generate sources
-            sources = generate_sources(content)
-            
-            return QueryResponse(
-                answer=content,
-                confidence=confidence,
-                processing_time=round(processing_time, 2),
-                sources=sources,
-                suggested_follow_ups=follow_ups,
-                timestamp=datetime.now().isoformat()
-            )
-            
+# Fingerprint of the frozen prompt - logged at startup so any accidental
+# drift that would break Groq's prompt-cache reuse is visible in the logs
+SYSTEM_PROMPT_SHA = hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()
+
+# User-prompt budget left over once the static system prompt is accounted for
+_MAX_USER_CHARS = _MAX_PROMPT_TOKENS * 4 - len(SYSTEM_PROMPT)
+
+# Groq request headers, built once at import instead of per request
+_api_key = os.getenv("GROQ_API_KEY")
+GROQ_HEADERS = {
+    "Authorization": f"Bearer {_api_key}",
+    "Content-Type": "application/json"
+} if _api_key else None
+
+def _build_groq_request(request: QueryRequest) -> tuple:
+    """Build the headers and payload for a Groq chat-completion call"""
+    # Build context-aware prompt
+    user_prompt = request.question
+    if request.context:
+        user_prompt += f"\n\nAdditional context: {request.context}"
+
+    # Keep the total prompt under budget (~4 chars per token estimate)
+    if len(user_prompt) > _MAX_USER_CHARS:
+        user_prompt = user_prompt[:_MAX_USER_CHARS]
+
+    payload = {
+        "model": "llama3-70b-8192",
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 2048
+    }
+
+    return GROQ_HEADERS, payload
+
+def _is_transient(response: httpx.Response) -> bool:
+    """Groq statuses worth retrying: rate limits and server-side errors"""
+    return response.status_code == 429 or response.status_code >= 500
+
+def _retry_wait(retry_state):
+    """Honor Groq's Retry-After header when present, else exponential jitter"""
+    outcome = retry_state.outcome
+    if outcome is not None and not outcome.failed:
+        retry_after = outcome.result().headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), 8.0)
+            except ValueError:
+                pass
+    return wait_exponential_jitter(initial=0.5, max=4.0)(retry_state)
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=_retry_wait,
+    retry=retry_if_exception_type(httpx.TransportError) | retry_if_result(_is_transient),
+    reraise=True,
+    retry_error_callback=lambda retry_state: retry_state.outcome.result()
+)
+async def _post_groq(groq_client: httpx.AsyncClient, headers: dict, payload: dict) -> httpx.Response:
+    """POST to Groq with backoff over transient transport and 429/5xx errors"""
+    return await groq_client.post(
+        "/openai/v1/chat/completions",
+        headers=headers,
+        json=payload
+    )
+
+# Prefilter for queries that don't need an LLM at all: greetings, smoke
+# tests and strings with no letters get a canned reply in microseconds
+_GREETING_RE = re.compile(r"^\s*(hi|hello|hey|test+|ping)\s*[!.?]*\s*$", re.I)
+
+_GREETING_ANSWER = (
+    "👋 Hi! Ask me about Kenyan startup funding, regulations, "
+    "accelerators, or markets."
+)
+
+prefilter_stats = {"hits": 0}
+
+def _prefilter(question: str) -> Optional[QueryResponse]:
+    """Return a canned response for trivial queries, or None to proceed"""
+    if _GREETING_RE.match(question) or not any(c.isalpha() for c in question):
+        prefilter_stats["hits"] += 1
+        return QueryResponse(
+            answer=_GREETING_ANSWER,
+            confidence=1.0,
+            processing_time=0.0,
+            sources=["Kenya Startup Ecosystem Database"],
+            suggested_follow_ups=list(_DEFAULT_FOLLOW_UPS),
+            timestamp=now_iso()
+        )
+    return None
+
+async def _run_one(request: QueryRequest, groq_client: httpx.AsyncClient) -> QueryResponse:
+    """Process a single query end-to-end: cache check, Groq call, post-processing"""
+    start_time = time.perf_counter()
+
+    # Answer trivial queries without touching Groq or the cache
+    shortcut = _prefilter(request.question)
+    if shortcut is not None:
+        return shortcut
+
+    # Serve repeated questions from the local cache
+    cache_key = query_cache.make_key(request.question, request.context)
+    cached = query_cache.get(cache_key, question=request.question)
+    if cached is not None:
+        return QueryResponse(
+            answer=cached["answer"],
+            confidence=cached["confidence"],
+            processing_time=round(time.perf_counter() - start_time, 2),
+            sources=cached["sources"],
+            suggested_follow_ups=cached["follow_ups"],
+            timestamp=now_iso()
+        )
+
+    headers, payload = _build_groq_request(request)
+
+    # Make API call to Groq using the shared pooled client, with retries
+    response = await _post_groq(groq_client, headers, payload)
+
+    if response.status_code == 401:
+        raise HTTPException(
+            status_code=500,
+            detail="Invalid Groq API key. Please check your GROQ_API_KEY."
+        )
+    elif response.status_code == 429:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded. Please try again in a moment."
+        )
+    elif response.status_code != 200:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Groq API error: {response.status_code} - {response.text}"
+        )
+
+    data = orjson.loads(response.content)
+
+    # Extract response content
+    if "choices" in data and data["choices"]:
+        content = data["choices"][0]["message"]["content"]
+    else:
+        content = "I apologize, but I couldn't generate a response. Please try again."
+
+    # Groq reports prompt-cache reuse in usage; surface it for observability
+    usage = data.get("usage") or data.get("x_groq", {}).get("usage", {})
+    cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    cache_hit_rate = round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0
+
+    # Calculate processing time
+    processing_time = time.perf_counter() - start_time
+
+    # Generate follow-up questions
+    follow_ups = generate_follow_ups(request.question)
+
+    # Calculate confidence based on response quality
+    confidence = calculate_confidence(content, request.question)
+
+    # Generate sources
+    sources = generate_sources(content)
+
+    # Cache the processed response for repeat queries
+    query_cache.set(cache_key, {
+        "answer": content,
+        "confidence": confidence,
+        "sources": sources,
+        "follow_ups": follow_ups
+    }, question=request.question)
+
+    return QueryResponse(
+        answer=content,
+        confidence=confidence,
+        processing_time=round(processing_time, 2),
+        sources=sources,
+        suggested_follow_ups=follow_ups,
+        timestamp=now_iso(),
+        cached_tokens=cached_tokens,
+        cache_hit_rate=cache_hit_rate
+    )
+
+# Main query endpoint
+@app.post("/api/v1/query", response_model=QueryResponse)
+async def process_query(request: QueryRequest, http_request: Request):
+    try:
+        async with GROQ_SEMAPHORE:
+            return await _run_one(request, http_request.app.state.groq_client)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(
-            status_code=500, 
+            status_code=500,
             detail=f"Error processing query: {str(e)}"
         )
 
+def _dumps(obj) -> str:
+    """Serialize to a JSON string via orjson (which returns bytes)"""
+    return orjson.dumps(obj).decode()
+
+# Streaming endpoint - forward Groq tokens as Server-Sent Events so the
+# frontend can render the answer as it arrives instead of waiting for the
+# full completion
+@app.post("/api/v1/query/stream")
+async def process_query_stream(request: QueryRequest, http_request: Request):
+    groq_client = http_request.app.state.groq_client
+    headers, payload = _build_groq_request(request)
+    payload["stream"] = True
+
+    cache_key = query_cache.make_key(request.question, request.context)
+
+    async def event_stream():
+        start_time = time.perf_counter()
+
+        # Cache hits stream back as one data frame plus the meta frame
+        cached = query_cache.get(cache_key, question=request.question)
+        if cached is not None:
+            yield f"data: {_dumps({'token': cached['answer']})}\n\n"
+            meta = {
+                "confidence": cached["confidence"],
+                "sources": cached["sources"],
+                "suggested_follow_ups": cached["follow_ups"],
+                "processing_time": round(time.perf_counter() - start_time, 2),
+                "timestamp": now_iso()
+            }
+            yield f"event: meta\ndata: {_dumps(meta)}\n\n"
+            return
+
+        chunks = []
+        async with GROQ_SEMAPHORE:
+            async with groq_client.stream(
+                "POST",
+                "/openai/v1/chat/completions",
+                headers=headers,
+                json=payload
+            ) as response:
+                if response.status_code != 200:
+                    detail = (await response.aread()).decode(errors="replace")
+                    error = {"error": f"Groq API error: {response.status_code} - {detail}"}
+                    yield f"event: error\ndata: {_dumps(error)}\n\n"
+                    return
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    chunk = line[len("data: "):]
+                    if chunk == "[DONE]":
+                        break
+                    delta = orjson.loads(chunk)["choices"][0]["delta"].get("content")
+                    if delta:
+                        chunks.append(delta)
+                        yield f"data: {_dumps({'token': delta})}\n\n"
+
+        # Post-process the full answer and emit it as a final meta frame
+        content = "".join(chunks)
+        follow_ups = generate_follow_ups(request.question)
+        confidence = calculate_confidence(content, request.question)
+        sources = generate_sources(content)
+        query_cache.set(cache_key, {
+            "answer": content,
+            "confidence": confidence,
+            "sources": sources,
+            "follow_ups": follow_ups
+        }, question=request.question)
+        meta = {
+            "confidence": confidence,
+            "sources": sources,
+            "suggested_follow_ups": follow_ups,
+            "processing_time": round(time.perf_counter() - start_time, 2),
+            "timestamp": now_iso()
+        }
+        yield f"event: meta\ndata: {_dumps(meta)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+# Batch endpoint - fan out several questions concurrently on the event loop
+@app.post("/api/v1/query/batch")
+async def process_query_batch(requests: List[QueryRequest], http_request: Request):
+    groq_client = http_request.app.state.groq_client
+
+    async def guarded(req: QueryRequest):
+        async with GROQ_SEMAPHORE:
+            return await _run_one(req, groq_client)
+
+    results = await asyncio.gather(
+        *(guarded(req) for req in requests),
+        return_exceptions=True
+    )
+
+    # Report per-item failures without failing the whole batch
+    responses = []
+    for result in results:
+        if isinstance(result, HTTPException):
+            responses.append({"error": result.detail, "status_code": result.status_code})
+        elif isinstance(result, Exception):
+            responses.append({"error": f"Error processing query: {result}", "status_code": 500})
+        else:
+            responses.append(result)
+    return responses
+
+# Follow-up routing table - each keyword group mapped to its precomputed
+# suggestions, all immutable so nothing is rebuilt per call
+_ROUTES = (
+    (frozenset({"funding", "invest", "money", "capital", "raise"}), (
+        "What documents do I need to prepare for investor meetings?",
+        "How long does the fundraising process typically take in Kenya?",
+        "What valuation should I expect at my current stage?"
+    )),
+    (frozenset({"legal", "register", "compliance", "law"}), (
+        "What are the ongoing compliance requirements after incorporation?",
+        "How much should I budget for legal and regulatory costs?",
+        "Which law firms in Kenya specialize in startups?"
+    )),
+    (frozenset({"accelerator", "incubator", "program"}), (
+        "What are the application requirements for top accelerators?",
+        "When are the next application deadlines?",
+        "How do I prepare for accelerator interviews?"
+    )),
+    (frozenset({"market", "customer", "competition"}), (
+        "How do I conduct effective market research in Kenya?",
+        "What are the key customer acquisition channels here?",
+        "How should I price my product for the Kenyan market?"
+    )),
+)
+
+_DEFAULT_FOLLOW_UPS = (
+    "How do I get started in Kenya's startup ecosystem?",
+    "What funding options are available for early-stage startups?",
+    "Which accelerators should I consider applying to in Nairobi?"
+)
+
+# Compile all keywords into one Aho-Corasick automaton at import time so
+# classification is a single linear scan of the question. Falls back to a
+# pure-stdlib frozenset word lookup when pyahocorasick isn't installed.
+if ahocorasick is not None:
+    _FOLLOW_UP_AUTOMATON = ahocorasick.Automaton()
+    for _keywords, _follow_ups in _ROUTES:
+        for _word in _keywords:
+            _FOLLOW_UP_AUTOMATON.add_word(_word, _follow_ups)
+    _FOLLOW_UP_AUTOMATON.make_automaton()
+else:
+    _FOLLOW_UP_AUTOMATON = None
+
 def generate_follow_ups(question: str) -> List[str]:
     """Generate relevant follow-up questions based on the query"""
-    question_lower = question.lower()
-    
-    if any(word in question_lower for word in ["funding", "invest", "money", "capital", "raise"]):
-        return [
-            "What documents do I need to prepare for investor meetings?",
-            "How long does the fundraising process typically take in Kenya?",
-            "What valuation should I expect at my current stage?"
-        ]
-    elif any(word in question_lower for word in ["legal", "register", "compliance", "law"]):
-        return [
-            "What are the ongoing compliance requirements after incorporation?",
-            "How much should I budget for legal and regulatory costs?",
-            "Which law firms in Kenya specialize in startups?"
-        ]
-    elif any(word in question_lower for word in ["accelerator", "incubator", "program"]):
-        return [
-            "What are the application requirements for top accelerators?",
-            "When are the next application deadlines?",
-            "How do I prepare for accelerator interviews?"
-        ]
-    elif any(word in question_lower for word in ["market", "customer", "competition"]):
-        return [
-            "How do I conduct effective market research in Kenya?",
-            "What are the key customer acquisition channels here?",
-            "How should I price my product for the Kenyan market?"
-        ]
+    if _FOLLOW_UP_AUTOMATON is not None:
+        for _, follow_ups in _FOLLOW_UP_AUTOMATON.iter(question.lower()):
+            return list(follow_ups)
     else:
-        return [
-            "How do I get started in Kenya's startup ecosystem?",
-            "What funding options are available for early-stage startups?",
-            "Which accelerators should I consider applying to in Nairobi?"
-        ]
+        words = frozenset(question.lower().split())
+        for keywords, follow_ups in _ROUTES:
+            if words & keywords:
+                return list(follow_ups)
+    return list(_DEFAULT_FOLLOW_UPS)
+
+# Scoring vocabularies for calculate_confidence (already lowercase)
+_KENYA_TERMS = (
+    'kenya', 'kenyan', 'nairobi', 'mombasa', 'kra', 'cbk', 'ihub',
+    'tlcom', 'novastar', 'mest', 'antler', 'shilling', 'east africa',
+    'kiico', 'ecitizen'
+)
+_STRUCTURE_INDICATORS = ("##", "**", "###", "- ", "1.", "2.", "3.")
 
 def calculate_confidence(content: str, question: str) -> float:
     """Calculate confidence score based on response quality"""
     if not content:
         return 0.0
-    
+
     score = 0.0
-    
+
     # Length factor
     length_score = min(len(content) / 1000, 1.0) * 0.3
     score += length_score
-    
-    # Kenya-specific content
-    kenya_terms = [
-        'kenya', 'kenyan', 'nairobi', 'mombasa', 'kra', 'cbk', 'ihub',
-        'tlcom', 'novastar', 'mest', 'antler', 'shilling', 'east africa',
-        'kiico', 'ecitizen'
-    ]
-    kenya_mentions = sum(1 for term in kenya_terms if term.lower() in content.lower())
+
+    # Kenya-specific content - lowercase once, scan against precomputed terms
+    content_lower = content.lower()
+    kenya_mentions = sum(1 for term in _KENYA_TERMS if term in content_lower)
     kenya_score = min(kenya_mentions / 5, 1.0) * 0.4
     score += kenya_score
-    
+
     # Structure indicators
-    structure_indicators = ["##", "**", "###", "- ", "1.", "2.", "3."]
-    structure_count = sum(1 for indicator in structure_indicators if indicator in content)
+    structure_count = sum(1 for indicator in _STRUCTURE_INDICATORS if indicator in content)
     structure_score = min(structure_count / 5, 1.0) * 0.2
     score += structure_score
     
@@ -268,29 +587,45 @@ def calculate_confidence(content: str, question: str) -> float:
     
     return min(score, 1.0)
 
+# Organization mentions that map to a citable source
+_SOURCE_TRIGGERS = (
+    ("tlcom", "TLcom Capital"),
+    ("novastar", "Novastar Ventures"),
+    ("ihub", "iHub Nairobi"),
+    ("mest", "MEST Africa"),
+    ("cbk", "Central Bank of Kenya"),
+    ("central bank", "Central Bank of Kenya"),
+    ("kra", "Kenya Revenue Authority"),
+)
+
 def generate_sources(content: str) -> List[str]:
     """Generate relevant sources based on content"""
     sources = ["Kenya Startup Ecosystem Database"]
-    
-    # Check for mentions of specific organizations
-    if "tlcom" in content.lower():
-        sources.append("TLcom Capital")
-    if "novastar" in content.lower():
-        sources.append("Novastar Ventures")
-    if "ihub" in content.lower():
-        sources.append("iHub Nairobi")
-    if "mest" in content.lower():
-        sources.append("MEST Africa")
-    if any(term in content.lower() for term in ["cbk", "central bank"]):
-        sources.append("Central Bank of Kenya")
-    if "kra" in content.lower():
-        sources.append("Kenya Revenue Authority")
-    
+
+    # Check for mentions of specific organizations - lowercase once
+    content_lower = content.lower()
+    seen = set()
+    for needle, name in _SOURCE_TRIGGERS:
+        if needle in content_lower and name not in seen:
+            seen.add(name)
+            sources.append(name)
+
     # Add AI source
     sources.append("Groq AI Analysis")
-    
+
     return sources[:4]  # Limit to 4 sources
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Prefork workers scale past the GIL; uvloop/httptools are the C-based
+    # loop and HTTP parser shipped with uvicorn[standard]. Each worker gets
+    # its own Groq client and in-memory cache.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 2)),
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
\ No newline at end of file